@@ -1,8 +1,13 @@
 # hermes_api.py
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
+import os
+import time
 import uuid
 from enum import Enum
 
@@ -15,6 +20,27 @@ app = FastAPI(
 # Temporäre In-Memory "Datenbank" - später ersetzen wir durch PostgreSQL
 projects_db = {}
 
+# Sentinel für Lookups mit nur einem Hash-Zugriff
+_MISSING = object()
+
+# Eine gemeinsame 404-Instanz; with_traceback(None) beim raise verhindert,
+# dass sich Tracebacks früherer Aufrufe an ihr ansammeln
+_PROJECT_NOT_FOUND = HTTPException(status_code=404, detail="Projekt nicht gefunden")
+
+# Serialisierte Antwort für GET /projects - wird bei jedem Schreibzugriff verworfen
+_all_projects_cache: Optional[bytes] = None
+_db_version = 0
+
+# (abgeschlossene, gesamte) Ergebnisse pro Projekt - beim Schreiben berechnet
+_result_counts = {}
+
+# Projektname pro ID - für Meldungen ohne Zugriff auf das ganze Projekt
+_project_names = {}
+
+# Zeitstempel für /health, höchstens alle 250ms neu formatiert
+_HEALTH_TICK = 0.25
+_health_timestamp = (float("-inf"), "")
+
 # Enums für bessere Type-Safety
 class ProjectApproach(str, Enum):
     CLASSICAL = "classical"
@@ -41,7 +67,15 @@ class DocumentStatus(str, Enum):
     COMPLETED = "completed"
 
 # Pydantic Models - kompatibel mit deinen Dataclasses!
-class ProjectMasterData(BaseModel):
+class HermesBaseModel(BaseModel):
+    """Gemeinsame Pydantic v2 Konfiguration für alle HERMES Modelle"""
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,  # keine Validierung bei jeder Zuweisung
+        ser_json_inf_nan='constants'
+    )
+
+class ProjectMasterData(HermesBaseModel):
     project_name: str = ""
     client: str = ""
     project_manager: str = ""
@@ -52,7 +86,7 @@ class ProjectMasterData(BaseModel):
     project_size: ProjectSize = ProjectSize.MEDIUM
     language: ProjectLanguage = ProjectLanguage.EN
 
-class PhaseResult(BaseModel):
+class PhaseResult(HermesBaseModel):
     name: str
     description: str = ""
     status: ResultStatus = ResultStatus.NOT_STARTED
@@ -60,16 +94,16 @@ class PhaseResult(BaseModel):
     approval_date: str = ""
     responsible_role: str = ""
 
-class ProjectPhase(BaseModel):
+class ProjectPhase(HermesBaseModel):
     name: str
-    results: Dict[str, PhaseResult] = {}
-    required_documents: List[str] = []
-    checklist_results: Dict[str, bool] = {}
+    results: Dict[str, PhaseResult] = Field(default_factory=dict)
+    required_documents: List[str] = Field(default_factory=list)
+    checklist_results: Dict[str, bool] = Field(default_factory=dict)
     status: str = "not_started"
     start_date: str = ""
     end_date: str = ""
 
-class HermesDocument(BaseModel):
+class HermesDocument(HermesBaseModel):
     name: str
     responsible: str = ""
     status: DocumentStatus = DocumentStatus.NOT_STARTED
@@ -77,14 +111,14 @@ class HermesDocument(BaseModel):
     linked_result: str = ""
     content: str = ""
 
-class HermesMilestone(BaseModel):
+class HermesMilestone(HermesBaseModel):
     name: str
     phase: str
     date: str = ""
     status: str = "planned"
     mandatory: bool = True
 
-class Iteration(BaseModel):
+class Iteration(HermesBaseModel):
     number: int
     name: str
     start_date: str
@@ -94,30 +128,34 @@ class Iteration(BaseModel):
     release_candidate: bool = False
     release_approved: bool = False
     status: str = "planned"
-    goals: List[str] = []
+    goals: List[str] = Field(default_factory=list)
 
-class BudgetTransaction(BaseModel):
+class BudgetTransaction(HermesBaseModel):
     date: str = ""
     category: str = ""
     amount: float = 0.0
     description: str = ""
     type: str = "actual"
 
-class HermesProject(BaseModel):
+class HermesProject(HermesBaseModel):
     id: Optional[str] = None
-    master_data: ProjectMasterData = ProjectMasterData()
-    phases: Dict[str, ProjectPhase] = {}
-    documents: Dict[str, HermesDocument] = {}
-    milestones: List[HermesMilestone] = []
-    iterations: List[Iteration] = []
-    budget_entries: List[BudgetTransaction] = []
+    master_data: ProjectMasterData = Field(default_factory=ProjectMasterData)
+    phases: Dict[str, ProjectPhase] = Field(default_factory=dict)
+    documents: Dict[str, HermesDocument] = Field(default_factory=dict)
+    milestones: List[HermesMilestone] = Field(default_factory=list)
+    iterations: List[Iteration] = Field(default_factory=list)
+    budget_entries: List[BudgetTransaction] = Field(default_factory=list)
     actual_costs: float = 0.0
-    tailoring: Dict[str, Any] = {}
+    tailoring: Dict[str, Any] = Field(default_factory=dict)
     current_phase: str = "initialization"
-    risks: List[Dict[str, Any]] = []
+    risks: List[Dict[str, Any]] = Field(default_factory=list)
     created_at: str = ""
     updated_at: str = ""
 
+# Einmal gebaute Validatoren/Serializer (pydantic-core)
+_project_adapter = TypeAdapter(HermesProject)
+_projects_adapter = TypeAdapter(List[HermesProject])
+
 # Helper Functions
 def create_default_phases() -> Dict[str, ProjectPhase]:
     """Erstellt Standard-Phasen für ein neues Projekt"""
@@ -142,6 +180,41 @@ def create_default_milestones() -> List[HermesMilestone]:
         HermesMilestone(name="Project Completed", phase="completion", mandatory=True)
     ]
 
+# Standardwerte einmalig beim Import als Rohdaten vorbereiten; pro Projekt
+# wird daraus nur noch per model_validate (pydantic-core) eine Kopie gebaut
+_DEFAULT_PHASES_DATA = {k: v.model_dump() for k, v in create_default_phases().items()}
+_DEFAULT_DOCUMENTS_DATA = {k: v.model_dump() for k, v in create_default_documents().items()}
+_DEFAULT_MILESTONES_DATA = [m.model_dump() for m in create_default_milestones()]
+
+# Laufende Zähler für /statistics - werden bei create/update/delete nachgeführt.
+# Die Enums sind geschlossen, daher reicht eine Liste pro Feld, indiziert über die Enum-Position.
+_APPROACH_INDEX = {a: i for i, a in enumerate(ProjectApproach)}
+_SIZE_INDEX = {s: i for i, s in enumerate(ProjectSize)}
+_approach_counts = [0] * len(ProjectApproach)
+_size_counts = [0] * len(ProjectSize)
+
+def _count_project(project: HermesProject, delta: int):
+    """Trägt ein Projekt in die Statistik-Zähler ein (delta=1) oder aus (delta=-1)"""
+    _approach_counts[_APPROACH_INDEX[project.master_data.approach]] += delta
+    _size_counts[_SIZE_INDEX[project.master_data.project_size]] += delta
+
+_DONE_STATUSES = frozenset((ResultStatus.COMPLETED, ResultStatus.APPROVED))
+
+def count_results(project: HermesProject) -> Tuple[int, int]:
+    """Zählt abgeschlossene und gesamte Ergebnisse über alle Phasen"""
+    total_results = 0
+    completed_results = 0
+    for phase in project.phases.values():
+        total_results += len(phase.results)
+        completed_results += sum(1 for r in phase.results.values() if r.status in _DONE_STATUSES)
+    return completed_results, total_results
+
+def _invalidate_projects_cache():
+    """Verwirft die zwischengespeicherte Projektliste nach einem Schreibzugriff"""
+    global _all_projects_cache, _db_version
+    _all_projects_cache = None
+    _db_version += 1
+
 # API Endpoints
 @app.get("/")
 async def root():
@@ -158,25 +231,37 @@ async def root():
 @app.get("/projects", response_model=List[HermesProject])
 async def get_all_projects():
     """Gibt alle gespeicherten Projekte zurück"""
-    return list(projects_db.values())
+    global _all_projects_cache
+    if _all_projects_cache is None:
+        # Serialisierung im Threadpool, damit der Event-Loop frei bleibt
+        version = _db_version
+        payload = await run_in_threadpool(_projects_adapter.dump_json, list(projects_db.values()))
+        if version != _db_version:
+            # Während der Serialisierung wurde geschrieben - nicht cachen
+            return Response(payload, media_type="application/json")
+        _all_projects_cache = payload
+    return Response(_all_projects_cache, media_type="application/json")
 
 @app.post("/projects", response_model=dict)
 async def create_project(project: HermesProject):
     """Erstellt ein neues HERMES Projekt"""
     project_id = str(uuid.uuid4())
     project.id = project_id
-    project.created_at = datetime.now().isoformat()
-    project.updated_at = datetime.now().isoformat()
+    project.created_at = project.updated_at = datetime.now().isoformat()
     
     # Standardwerte setzen falls nicht vorhanden
     if not project.phases:
-        project.phases = create_default_phases()
+        project.phases = {k: ProjectPhase.model_validate(v) for k, v in _DEFAULT_PHASES_DATA.items()}
     if not project.documents:
-        project.documents = create_default_documents()
+        project.documents = {k: HermesDocument.model_validate(v) for k, v in _DEFAULT_DOCUMENTS_DATA.items()}
     if not project.milestones:
-        project.milestones = create_default_milestones()
+        project.milestones = [HermesMilestone.model_validate(m) for m in _DEFAULT_MILESTONES_DATA]
     
-    projects_db[project_id] = project.dict()
+    projects_db[project_id] = project
+    _count_project(project, 1)
+    _result_counts[project_id] = count_results(project)
+    _project_names[project_id] = project.master_data.project_name
+    _invalidate_projects_cache()
     return {
         "project_id": project_id, 
         "message": "Projekt erfolgreich erstellt",
@@ -186,18 +271,40 @@ async def create_project(project: HermesProject):
 @app.get("/projects/{project_id}", response_model=HermesProject)
 async def get_project(project_id: str):
     """Holt ein bestimmtes Projekt anhand der ID"""
-    if project_id not in projects_db:
-        raise HTTPException(status_code=404, detail="Projekt nicht gefunden")
-    return projects_db[project_id]
+    project = projects_db.get(project_id, _MISSING)
+    if project is _MISSING:
+        raise _PROJECT_NOT_FOUND.with_traceback(None)
+    return project
 
-@app.put("/projects/{project_id}", response_model=dict)
-async def update_project(project_id: str, project: HermesProject):
+@app.put(
+    "/projects/{project_id}",
+    response_model=dict,
+    # Body wird selbst validiert - Schema für /docs explizit angeben
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/HermesProject"}}}
+    }}
+)
+async def update_project(project_id: str, request: Request):
     """Aktualisiert ein bestehendes Projekt"""
-    if project_id not in projects_db:
-        raise HTTPException(status_code=404, detail="Projekt nicht gefunden")
+    # Rohen Body in einem Durchgang in pydantic-core parsen und validieren
+    try:
+        project = _project_adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)])
+    
+    # Lookup erst nach dem await, damit ein zwischenzeitliches Löschen erkannt wird
+    previous = projects_db.get(project_id, _MISSING)
+    if previous is _MISSING:
+        raise _PROJECT_NOT_FOUND.with_traceback(None)
     
     project.updated_at = datetime.now().isoformat()
-    projects_db[project_id] = project.dict()
+    _count_project(previous, -1)
+    projects_db[project_id] = project
+    _count_project(project, 1)
+    _result_counts[project_id] = count_results(project)
+    _project_names[project_id] = project.master_data.project_name
+    _invalidate_projects_cache()
     return {
         "message": "Projekt erfolgreich aktualisiert",
         "project_name": project.master_data.project_name,
@@ -207,48 +314,51 @@ async def update_project(project_id: str, project: HermesProject):
 @app.delete("/projects/{project_id}", response_model=dict)
 async def delete_project(project_id: str):
     """Löscht ein Projekt"""
-    if project_id not in projects_db:
-        raise HTTPException(status_code=404, detail="Projekt nicht gefunden")
+    project = projects_db.pop(project_id, _MISSING)
+    if project is _MISSING:
+        raise _PROJECT_NOT_FOUND.with_traceback(None)
     
-    project_name = projects_db[project_id].get('master_data', {}).get('project_name', 'Unbekannt')
-    del projects_db[project_id]
+    _count_project(project, -1)
+    _result_counts.pop(project_id, None)
+    project_name = _project_names.pop(project_id, 'Unbekannt')
+    _invalidate_projects_cache()
     return {"message": f"Projekt '{project_name}' erfolgreich gelöscht"}
 
 @app.get("/projects/{project_id}/health")
 async def get_project_health(project_id: str):
     """Gibt Gesundheitsstatus eines Projekts zurück"""
-    if project_id not in projects_db:
-        raise HTTPException(status_code=404, detail="Projekt nicht gefunden")
+    project = projects_db.get(project_id, _MISSING)
+    if project is _MISSING:
+        raise _PROJECT_NOT_FOUND.with_traceback(None)
     
-    project = projects_db[project_id]
-    
-    # Einfache Health-Check Logik
-    total_results = 0
-    completed_results = 0
-    
-    for phase in project.get('phases', {}).values():
-        for result in phase.get('results', {}).values():
-            total_results += 1
-            if result.get('status') in ['completed', 'approved']:
-                completed_results += 1
+    # Einfache Health-Check Logik - Zähler stammen aus create/update
+    completed_results, total_results = _result_counts[project_id]
     
     progress = (completed_results / total_results * 100) if total_results > 0 else 0
     
     return {
         "project_id": project_id,
-        "project_name": project.get('master_data', {}).get('project_name'),
+        "project_name": project.master_data.project_name,
         "progress": f"{progress:.1f}%",
-        "phase": project.get('current_phase', 'unknown'),
-        "last_updated": project.get('updated_at')
+        "phase": project.current_phase,
+        "last_updated": project.updated_at
     }
 
+def _cached_now_iso() -> str:
+    """Aktueller ISO-Zeitstempel, pro Tick von 250ms zwischengespeichert"""
+    global _health_timestamp
+    now = time.monotonic()
+    if now - _health_timestamp[0] >= _HEALTH_TICK:
+        _health_timestamp = (now, datetime.now().isoformat())
+    return _health_timestamp[1]
+
 # Utility Endpoints
 @app.get("/health")
 async def health_check():
     """Health Check für die API"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _cached_now_iso(),
         "project_count": len(projects_db),
         "version": "1.0.0"
     }
@@ -257,8 +367,7 @@ async def health_check():
 async def get_statistics():
     """Gibt Statistiken über alle Projekte zurück"""
     total_projects = len(projects_db)
-    classical_count = sum(1 for p in projects_db.values() 
-                         if p.get('master_data', {}).get('approach') == 'classical')
+    classical_count = _approach_counts[_APPROACH_INDEX[ProjectApproach.CLASSICAL]]
     agile_count = total_projects - classical_count
     
     return {
@@ -266,24 +375,24 @@ async def get_statistics():
         "classical_projects": classical_count,
         "agile_projects": agile_count,
         "projects_by_size": {
-            "small": sum(1 for p in projects_db.values() 
-                        if p.get('master_data', {}).get('project_size') == 'small'),
-            "medium": sum(1 for p in projects_db.values() 
-                         if p.get('master_data', {}).get('project_size') == 'medium'),
-            "large": sum(1 for p in projects_db.values() 
-                        if p.get('master_data', {}).get('project_size') == 'large')
+            "small": _size_counts[_SIZE_INDEX[ProjectSize.SMALL]],
+            "medium": _size_counts[_SIZE_INDEX[ProjectSize.MEDIUM]],
+            "large": _size_counts[_SIZE_INDEX[ProjectSize.LARGE]]
         }
     }
 
-# CORS Middleware (wichtig für Streamlit)
+# CORS Middleware (wichtig für Streamlit) - reine ASGI Middleware, kein BaseHTTPMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 
+# Explizite Origins statt "*" - weitere per HERMES_CORS_ORIGINS (kommagetrennt)
+CORS_ORIGINS = os.environ.get("HERMES_CORS_ORIGINS", "http://localhost:8501,http://127.0.0.1:8501").split(",")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Für Entwicklung - später einschränken
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["content-type", "authorization"],
 )
 
 if __name__ == "__main__":
@@ -291,4 +400,14 @@ if __name__ == "__main__":
     print("🚀 Starting HERMES API Server...")
     print("📚 API Documentation: http://localhost:8000/docs")
     print("🔍 Health Check: http://localhost:8000/health")
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # "auto" nimmt uvloop + httptools, wenn installiert, sonst asyncio/h11 (z.B. unter Windows).
+    # Mehrere Worker nur per HERMES_API_WORKERS, da jeder Worker seine eigene In-Memory "Datenbank" hätte.
+    uvicorn.run(
+        "hermes_api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=int(os.environ.get("HERMES_API_WORKERS", "1")),
+        reload=False
+    )
@@ -1,23 +1,27 @@
 # hermes_app.py
 import streamlit as st
 import pandas as pd
-import json
+import orjson
+import hashlib
+from sys import intern
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional
-import plotly.express as px
-import plotly.graph_objects as go
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from collections import namedtuple
+from typing import List, Dict, Optional, Tuple
+from functools import wraps
+from time import perf_counter
+from pathlib import Path
+from types import MappingProxyType
 from io import BytesIO
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+# plotly, reportlab, matplotlib and xlsxwriter are imported inside the functions that use them,
+# so a rerun of a page that draws no chart and builds no report never loads them
 
 # ----------------------
 # DATACLASSES
 # ----------------------
-@dataclass
+@dataclass(slots=True)
 class ProjectMasterData:
     project_name: str = ""
     client: str = ""
@@ -29,7 +33,7 @@ class ProjectMasterData:
     project_size: str = "medium"  # small/medium/large
     language: str = "en"  # 'en' or 'de'
 
-@dataclass
+@dataclass(slots=True)
 class PhaseResult:
     name: str
     description: str = ""
@@ -38,7 +42,7 @@ class PhaseResult:
     approval_date: str = ""
     responsible_role: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ProjectPhase:
     name: str
     results: Dict[str, PhaseResult] = field(default_factory=dict)
@@ -48,7 +52,7 @@ class ProjectPhase:
     start_date: str = ""
     end_date: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class HermesDocument:
     name: str
     responsible: str = ""
@@ -57,7 +61,7 @@ class HermesDocument:
     linked_result: str = ""
     content: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class HermesMilestone:
     name: str
     phase: str
@@ -65,7 +69,7 @@ class HermesMilestone:
     status: str = "planned"  # planned/reached/delayed
     mandatory: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class Iteration:
     number: int
     name: str
@@ -81,7 +85,7 @@ class Iteration:
     def progress(self) -> float:
         return (self.completed_user_stories / self.total_user_stories * 100) if self.total_user_stories > 0 else 0.0
 
-@dataclass
+@dataclass(slots=True)
 class BudgetTransaction:
     date: str = ""
     category: str = ""
@@ -89,7 +93,7 @@ class BudgetTransaction:
     description: str = ""
     type: str = "actual"  # actual or planned
 
-@dataclass
+@dataclass(slots=True)
 class HermesProject:
     master_data: ProjectMasterData = field(default_factory=ProjectMasterData)
     phases: Dict[str, ProjectPhase] = field(default_factory=dict)
@@ -101,6 +105,9 @@ class HermesProject:
     tailoring: Dict = field(default_factory=dict)
     current_phase: str = "initialization"
     risks: List[Dict] = field(default_factory=list)
+    # change counter + cached metrics (see touch); underscore fields stay out of the JSON export
+    _version: int = field(default=0, repr=False, compare=False)
+    _metrics: Optional[tuple] = field(default=None, repr=False, compare=False)
 
 # ----------------------
 # CONSTANTS: Roles, Checklists, Project size tailoring
@@ -177,65 +184,106 @@ HERMES_CHECKLISTS = {
     }
 }
 
+# document/milestone lists are tuples: constants that tailoring only reads
 PROJECT_SIZE_CONFIGS = {
     "small": {
         "simplified_checklists": True,
-        "required_documents": ["Project Charter", "Acceptance Protocol"],
-        "optional_documents": ["Study", "Operating Handbook"],
-        "mandatory_milestones": ["Project Start", "Project Completed"]
+        "required_documents": ("Project Charter", "Acceptance Protocol"),
+        "optional_documents": ("Study", "Operating Handbook"),
+        "mandatory_milestones": ("Project Start", "Project Completed")
     },
     "medium": {
         "simplified_checklists": False,
-        "required_documents": ["Project Charter", "Project Management Plan", "Solution Requirements"],
-        "optional_documents": ["Migration Concept"],
-        "mandatory_milestones": ["Project Start", "Implementation Decision", "Project Completed"]
+        "required_documents": ("Project Charter", "Project Management Plan", "Solution Requirements"),
+        "optional_documents": ("Migration Concept",),
+        "mandatory_milestones": ("Project Start", "Implementation Decision", "Project Completed")
     },
     "large": {
         "simplified_checklists": False,
-        "required_documents": ["Project Charter", "Study", "Project Management Plan", "Solution Architecture", "Test Concept"],
-        "optional_documents": [],
-        "mandatory_milestones": ["Project Start", "Implementation Decision", "Phase Release Concept", "Phase Release Realization", "Project Completed"]
+        "required_documents": ("Project Charter", "Study", "Project Management Plan", "Solution Architecture", "Test Concept"),
+        "optional_documents": (),
+        "mandatory_milestones": ("Project Start", "Implementation Decision", "Phase Release Concept", "Phase Release Realization", "Project Completed")
     }
 }
 
+# frozensets for O(1) membership tests during tailoring (the tuples keep their order for display)
+REQUIRED_DOCUMENT_SETS = {size: frozenset(cfg["required_documents"]) for size, cfg in PROJECT_SIZE_CONFIGS.items()}
+
+# map mandatory milestone names to phases roughly
+MILESTONE_PHASE_MAP = {
+    "Project Start": "initialization",
+    "Implementation Decision": "concept",
+    "Phase Release Concept": "concept",
+    "Phase Release Realization": "implementation",
+    "Project Completed": "completion"
+}
+
+# example results per phase, created when a phase has none yet: (name, approval required, responsible role)
+DEFAULT_PHASE_RESULTS = {
+    "initialization": (("Project Charter", True, "Project Manager"), ("Stakeholder Analysis", False, "Project Manager")),
+    "concept": (("Solution Requirements", True, "User Representative"), ("Solution Architecture", True, "Project Manager")),
+    "implementation": (("Increment Delivery", False, "Project Manager"),),
+    "introduction": (("Operational Handover", False, "Project Manager"),),
+    "completion": (("Project Completion Report", True, "Project Manager"),),
+}
+
+# selectbox options with their position, so widgets look up the index instead of scanning a fresh list
+PROJECT_SIZES = ("small", "medium", "large")
+PROJECT_SIZE_IDX = {s: i for i, s in enumerate(PROJECT_SIZES)}
+RESULT_STATUSES = ("not_started", "in_progress", "completed", "approved")
+RESULT_STATUS_IDX = {s: i for i, s in enumerate(RESULT_STATUSES)}
+DOCUMENT_STATUSES = ("not_started", "in_progress", "completed")
+DOCUMENT_STATUS_IDX = {s: i for i, s in enumerate(DOCUMENT_STATUSES)}
+ITERATION_STATUSES = ("planned", "active", "completed")
+ITERATION_STATUS_IDX = {s: i for i, s in enumerate(ITERATION_STATUSES)}
+
 # ----------------------
 # SERIALIZATION HELPERS
 # ----------------------
 def dataclass_to_dict(obj):
-    """Recursively convert dataclass instances to dictionaries (for JSON export)"""
-    if isinstance(obj, list):
-        return [dataclass_to_dict(i) for i in obj]
-    elif hasattr(obj, "__dataclass_fields__"):
-        result = {}
-        for k, v in asdict(obj).items():
-            result[k] = dataclass_to_dict(v)
-        result["_type"] = obj.__class__.__name__
-        return result
-    elif isinstance(obj, dict):
-        return {k: dataclass_to_dict(v) for k, v in obj.items()}
-    else:
-        return obj
+    """Top-level field dict of a dataclass (for JSON export).
+    Nested dataclasses are left as-is - orjson serializes them natively without asdict copies."""
+    result = {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith("_")}
+    result["_type"] = obj.__class__.__name__
+    return result
+
+def content_key(obj) -> str:
+    """Short content hash of anything orjson serializes (dataclasses included), used as a cache key"""
+    return hashlib.blake2b(orjson.dumps(obj), digest_size=16).hexdigest()
+
+def _intern(v):
+    # imported JSON may hold null or numbers where a string is expected; sys.intern only takes str
+    return intern(v) if type(v) is str else v
 
 def dict_to_dataclass(d):
     """Convert the top-level structure (expects HermesProject-like dict)."""
     # This is a practical approach assuming exported structure from dataclass_to_dict
     # We'll manually reconstruct HermesProject
+    # Enum-like strings (status, type, approach, ...) are interned: every row then shares one object
+    # and comparisons against the literals in the code hit the identity fast path.
+    # Phase, result and document keys, and the values later used to look them up
+    # (milestone phase, linked result), are interned too so those dict probes compare by identity.
     try:
         md = d.get("master_data", {})
         master = ProjectMasterData(**md)
+        master.approach = _intern(master.approach)
+        master.project_size = _intern(master.project_size)
+        master.language = _intern(master.language)
         project = HermesProject(master_data=master)
         # phases
         for pname, pdata in d.get("phases", {}).items():
+            pname = intern(pname)
             phase = ProjectPhase(name=pdata.get("name", pname),
-                                 status=pdata.get("status", "not_started"),
+                                 status=_intern(pdata.get("status", "not_started")),
                                  start_date=pdata.get("start_date", ""),
                                  end_date=pdata.get("end_date", ""))
             # results
             for rname, rdata in pdata.get("results", {}).items():
+                rname = intern(rname)
                 rr = PhaseResult(
                     name=rdata.get("name", rname),
                     description=rdata.get("description", ""),
-                    status=rdata.get("status", "not_started"),
+                    status=_intern(rdata.get("status", "not_started")),
                     approval_required=rdata.get("approval_required", False),
                     approval_date=rdata.get("approval_date", ""),
                     responsible_role=rdata.get("responsible_role", "")
@@ -246,12 +294,13 @@ def dict_to_dataclass(d):
             project.phases[pname] = phase
         # documents
         for dname, ddata in d.get("documents", {}).items():
+            dname = intern(dname)
             doc = HermesDocument(
                 name=ddata.get("name", dname),
                 responsible=ddata.get("responsible", ""),
-                status=ddata.get("status", "not_started"),
+                status=_intern(ddata.get("status", "not_started")),
                 required=ddata.get("required", True),
-                linked_result=ddata.get("linked_result", ""),
+                linked_result=_intern(ddata.get("linked_result", "")),
                 content=ddata.get("content", "")
             )
             project.documents[dname] = doc
@@ -259,9 +308,9 @@ def dict_to_dataclass(d):
         for ms in d.get("milestones", []):
             m = HermesMilestone(
                 name=ms.get("name", ""),
-                phase=ms.get("phase", ""),
+                phase=_intern(ms.get("phase", "")),
                 date=ms.get("date", ""),
-                status=ms.get("status", "planned"),
+                status=_intern(ms.get("status", "planned")),
                 mandatory=ms.get("mandatory", True)
             )
             project.milestones.append(m)
@@ -276,7 +325,7 @@ def dict_to_dataclass(d):
                 completed_user_stories=it.get("completed_user_stories", 0),
                 release_candidate=it.get("release_candidate", False),
                 release_approved=it.get("release_approved", False),
-                status=it.get("status", "planned"),
+                status=_intern(it.get("status", "planned")),
                 goals=it.get("goals", [])
             )
             project.iterations.append(iteration)
@@ -284,13 +333,13 @@ def dict_to_dataclass(d):
         for t in d.get("budget_entries", []):
             tr = BudgetTransaction(
                 date=t.get("date", ""),
-                category=t.get("category", ""),
+                category=_intern(t.get("category", "")),
                 amount=t.get("amount", 0.0),
                 description=t.get("description", ""),
-                type=t.get("type", "actual")
+                type=_intern(t.get("type", "actual"))
             )
-            project.budget_entries.append(tr)
-        project.actual_costs = d.get("actual_costs", 0.0)
+            add_budget_transaction(project, tr)
+        # actual_costs is rebuilt from the entries above; the exported value is not trusted
         project.current_phase = d.get("current_phase", "initialization")
         project.tailoring = d.get("tailoring", {})
         return project
@@ -327,78 +376,147 @@ def init_session_state():
 # ----------------------
 # CALCULATIONS & UTILITIES
 # ----------------------
+# result states that count as done for progress
+DONE_STATUSES = frozenset(("completed", "approved"))
+
+def today_iso() -> str:
+    """Today's date as YYYY-MM-DD (date.isoformat is a C fast path, strftime parses its format string)"""
+    return datetime.now().date().isoformat()
+
+def touch(project: HermesProject):
+    """Mark the project as changed so the cached metrics are recomputed.
+    Call after adding results or changing result statuses, checklists or actual costs."""
+    project._version += 1
+
+def add_budget_transaction(project: HermesProject, tx: BudgetTransaction):
+    """Append a transaction and keep the running actual total in project.actual_costs"""
+    project.budget_entries.append(tx)
+    if tx.type == "actual":
+        project.actual_costs += tx.amount
+        touch(project)
+
+def calculate_actual_costs(project: HermesProject) -> float:
+    # maintained by add_budget_transaction instead of summing all entries on every rerun
+    return project.actual_costs
+
 def calculate_budget_usage(project: HermesProject) -> float:
-    actual_costs = sum(t.amount for t in project.budget_entries if t.type == "actual")
+    actual_costs = calculate_actual_costs(project)
     if project.master_data.budget and project.master_data.budget > 0:
         return actual_costs / project.master_data.budget
     return 0.0
 
-def calculate_phase_progress(phase: ProjectPhase) -> float:
-    total = len(phase.results)
-    if total == 0:
-        return 0.0
-    completed = sum(1 for r in phase.results.values() if r.status in ["completed", "approved"])
-    return completed / total * 100.0
-
 def calculate_total_progress(project: HermesProject) -> float:
-    phases = project.phases.values()
-    if not phases:
-        return 0.0
-    return sum(calculate_phase_progress(p) for p in phases) / len(list(phases))
+    return compute_project_metrics(project).progress
 
-def calculate_risk_level(project: HermesProject) -> str:
+def risk_level(progress: float, usage: float) -> str:
     # simple heuristic
-    progress = calculate_total_progress(project)
-    usage = calculate_budget_usage(project)
     if progress > 80 and usage < 0.8:
         return "low"
     if progress > 50 or usage < 0.9:
         return "medium"
     return "high"
 
-def calculate_quality_score(project: HermesProject) -> int:
+ProjectMetrics = namedtuple("ProjectMetrics", ["progress", "quality", "risk", "budget_usage", "actual_costs", "phase_progress", "phase_counts"])
+
+def cached_metrics(project: HermesProject) -> Optional[ProjectMetrics]:
+    """Metrics from the last compute_project_metrics call if the project has not changed since (else None)"""
+    cached = project._metrics
+    if cached is not None and cached[0] == project._version and cached[1] == project.master_data.budget:
+        return cached[2]
+    return None
+
+def compute_project_metrics(project: HermesProject) -> ProjectMetrics:
+    """All dashboard/report aggregates from a single walk over the phases.
+    phase_progress maps phase key -> percent, phase_counts maps phase key -> (completed, total).
+    The result is cached on the project until touch() is called or the budget changes."""
+    metrics = cached_metrics(project)
+    if metrics is not None:
+        return metrics
+    phase_progress = {}
+    phase_counts = {}
     total_items = 0
     good_items = 0
-    for p in project.phases.values():
-        for checklist_val in p.checklist_results.values():
-            total_items += 1
-            if checklist_val:
-                good_items += 1
+    for key, p in project.phases.items():
+        completed = 0
+        approved = 0
         for r in p.results.values():
-            total_items += 1
             if r.status == "approved":
-                good_items += 1
-    return int((good_items / total_items * 100) if total_items > 0 else 0)
+                approved += 1
+                completed += 1
+            elif r.status == "completed":
+                completed += 1
+        total = len(p.results)
+        phase_counts[key] = (completed, total)
+        phase_progress[key] = completed / total * 100.0 if total else 0.0
+        total_items += total + len(p.checklist_results)
+        good_items += approved + sum(map(bool, p.checklist_results.values()))  # counts ticked items in C
+    progress = sum(phase_progress.values()) / len(phase_progress) if phase_progress else 0.0
+    quality = int((good_items / total_items * 100) if total_items > 0 else 0)
+    actual = calculate_actual_costs(project)
+    budget = project.master_data.budget
+    usage = actual / budget if budget and budget > 0 else 0.0
+    metrics = ProjectMetrics(progress, quality, risk_level(progress, usage), usage, actual, phase_progress, phase_counts)
+    project._metrics = (project._version, budget, metrics)
+    return metrics
+
+def calculate_risk_level(project: HermesProject) -> str:
+    return compute_project_metrics(project).risk
+
+def calculate_quality_score(project: HermesProject) -> int:
+    return compute_project_metrics(project).quality
+
+# ----------------------
+# CACHE STATS (shown in the sidebar with ?debug=1)
+# ----------------------
+@st.cache_resource(show_spinner=False)
+def cache_stats() -> Dict[str, Dict[str, float]]:
+    """Per-function counters of the observed caches, kept for the whole process"""
+    return {}
+
+def observed_cache(cache_decorator):
+    """Apply `cache_decorator` (st.cache_data(...) / st.cache_resource(...)) and count calls, misses and miss time.
+    Only a miss runs the inner function, so calls - misses are the hits."""
+    def decorate(fn):
+        name = fn.__name__
+        def entry():
+            return cache_stats().setdefault(name, {"calls": 0, "misses": 0, "miss_seconds": 0.0, "last_miss_seconds": 0.0})
+        @wraps(fn)
+        def timed(*args, **kwargs):
+            t0 = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - t0
+                stats = entry()
+                stats["misses"] += 1
+                stats["miss_seconds"] += elapsed
+                stats["last_miss_seconds"] = elapsed
+        cached = cache_decorator(timed)
+        @wraps(fn)
+        def counted(*args, **kwargs):
+            entry()["calls"] += 1
+            return cached(*args, **kwargs)
+        counted.clear = cached.clear
+        return counted
+    return decorate
 
 # ----------------------
 # INSTRUCTIONS HELPER (multilingual)
 # ----------------------
-INSTRUCTIONS = {
-    "en": {
-        "dashboard": "Overview of budget, phases, milestones and health indicators. Tip: update costs frequently.",
-        "initialization": "Enter master data, choose approach (classical/agile) and project size. Tailoring will be applied automatically.",
-        "results": "Create and manage results for each phase. Mark results complete and request approvals where required.",
-        "budget": "Add budget transactions (planned/actual) and monitor usage. Export for stakeholders.",
-        "milestones": "Visualize milestones, run governance checks and reach milestones only when prerequisites met.",
-        "iterations": "Create iterations (sprints), track progress and approve releases when criteria fulfilled.",
-        "documents": "Manage documents, link them to results. Completed documents automatically update result status.",
-        "info": "HERMES methodology adapted for configurable classical/agile projects."
-    },
-    "de": {
-        "dashboard": "Übersicht zu Budget, Phasen, Meilensteinen und Gesundheitsindikatoren. Tipp: Kosten regelmässig aktualisieren.",
-        "initialization": "Geben Sie Stammdaten ein, wählen Sie Vorgehen (klassisch/agil) und Projektgröße. Tailoring wird automatisch angewendet.",
-        "results": "Erstellen und verwalten Sie Ergebnisse für jede Phase. Markieren Sie Ergebnisse als abgeschlossen und fordern Sie Genehmigungen an.",
-        "budget": "Fügen Sie Budgettransaktionen (geplant/tatsächlich) hinzu und überwachen Sie die Nutzung. Export für Stakeholder möglich.",
-        "milestones": "Visualisieren Sie Meilensteine, führen Sie Governance-Checks durch und erreichen Sie Meilensteine nur bei Erfüllung der Voraussetzungen.",
-        "iterations": "Erstellen Sie Iterationen (Sprints), verfolgen Sie den Fortschritt und genehmigen Releases, wenn Kriterien erfüllt sind.",
-        "documents": "Verwalten Sie Dokumente und verknüpfen Sie diese mit Ergebnissen. Abgeschlossene Dokumente aktualisieren Ergebnisstatus automatisch.",
-        "info": "HERMES-Methodik, angepasst für konfigurierbare klassische/agile Projekte."
-    }
-}
+# instruction texts live in translations/<lang>.json and are loaded per language on first use
+TRANSLATIONS_DIR = Path(__file__).resolve().parent / "translations"
+SUPPORTED_LANGUAGES = ("en", "de")
+
+@observed_cache(st.cache_resource(show_spinner=False))
+def load_instructions(lang: str) -> MappingProxyType:
+    """Read-only instruction table of one language, parsed once per process and shared across reruns"""
+    if lang not in SUPPORTED_LANGUAGES:
+        lang = "en"
+    return MappingProxyType(orjson.loads((TRANSLATIONS_DIR / f"{lang}.json").read_bytes()))
 
 def t(key: str, project: HermesProject) -> str:
     lang = project.master_data.language if project and project.master_data else "en"
-    return INSTRUCTIONS.get(lang, INSTRUCTIONS["en"]).get(key, "")
+    return load_instructions(lang).get(key, "")
 
 def show_instructions(title: str, text: str):
     with st.expander(f"ℹ️ {title} - Instructions", expanded=False):
@@ -419,11 +537,11 @@ def project_initialization():
             project.master_data.project_manager = st.text_input("Project Manager", project.master_data.project_manager)
             project.master_data.user_representative = st.text_input("User Representative", project.master_data.user_representative)
         with col2:
-            sd = datetime.now() if not project.master_data.start_date else datetime.strptime(project.master_data.start_date, "%Y-%m-%d")
-            project.master_data.start_date = st.date_input("Start Date", sd).strftime("%Y-%m-%d")
+            sd = datetime.now() if not project.master_data.start_date else datetime.fromisoformat(project.master_data.start_date)
+            project.master_data.start_date = st.date_input("Start Date", sd).isoformat()
             project.master_data.budget = st.number_input("Budget (CHF)", min_value=0.0, value=float(project.master_data.budget or 100000.0))
             project.master_data.approach = st.selectbox("Approach", ["classical", "agile"], index=0 if project.master_data.approach=="classical" else 1)
-            project.master_data.project_size = st.selectbox("Project Size", ["small","medium","large"], index=["small","medium","large"].index(project.master_data.project_size))
+            project.master_data.project_size = st.selectbox("Project Size", PROJECT_SIZES, index=PROJECT_SIZE_IDX[project.master_data.project_size])
             project.master_data.language = st.selectbox("Language / Sprache", ["en","de"], index=0 if project.master_data.language=="en" else 1)
         if st.form_submit_button("Initialize Project"):
             # apply tailoring
@@ -431,75 +549,89 @@ def project_initialization():
             st.success("Project initialized and tailoring applied!")
 
 def apply_tailoring(project: HermesProject):
-    cfg = PROJECT_SIZE_CONFIGS.get(project.master_data.project_size, PROJECT_SIZE_CONFIGS["medium"])
+    size = project.master_data.project_size if project.master_data.project_size in PROJECT_SIZE_CONFIGS else "medium"
+    cfg = PROJECT_SIZE_CONFIGS[size]
+    required = REQUIRED_DOCUMENT_SETS[size]
     # mark documents
     for docname, doc in project.documents.items():
-        doc.required = docname in cfg["required_documents"]
+        doc.required = docname in required
     # add any missing required documents
     for dn in cfg["required_documents"]:
         if dn not in project.documents:
             project.documents[dn] = HermesDocument(name=dn, responsible="Project Manager", required=True)
     project.tailoring = {"size": project.master_data.project_size, "simplified_checklists": cfg["simplified_checklists"]}
     # ensure mandatory milestones present
+    existing = {m.name for m in project.milestones}
     for mn in cfg["mandatory_milestones"]:
-        if not any(m.name == mn for m in project.milestones):
-            # map names to phases roughly
-            phase_map = {
-                "Project Start":"initialization",
-                "Implementation Decision":"concept",
-                "Phase Release Concept":"concept",
-                "Phase Release Realization":"implementation",
-                "Project Completed":"completion"
-            }
-            project.milestones.append(HermesMilestone(name=mn, phase=phase_map.get(mn, "implementation"), mandatory=True))
+        if mn not in existing:
+            project.milestones.append(HermesMilestone(name=mn, phase=MILESTONE_PHASE_MAP.get(mn, "implementation"), mandatory=True))
 
 # ----------------------
 # RESULTS MANAGEMENT
 # ----------------------
+@st.fragment
+def phase_results(project: HermesProject, phase_key: str, phase: ProjectPhase):
+    """Results of one phase; a widget change in here only reruns this phase, not the whole page"""
+    with st.expander(f"{phase.name} (status: {phase.status})", expanded=False):
+        # create results if empty (defaults)
+        if not phase.results:
+            for name, approval_required, role in DEFAULT_PHASE_RESULTS.get(phase_key, ()):
+                phase.results[name] = PhaseResult(name=name, approval_required=approval_required, responsible_role=role)
+            touch(project)
+        for rkey, result in phase.results.items():
+            cols = st.columns([3,1,1])
+            with cols[0]:
+                st.write(f"**{result.name}**")
+                if result.description:
+                    st.caption(result.description)
+                st.caption(f"Responsible Role: {result.responsible_role or '—'}")
+            with cols[1]:
+                new_status = st.selectbox(f"Status {phase_key}_{rkey}", RESULT_STATUSES, index=RESULT_STATUS_IDX[result.status])
+                if new_status != result.status:
+                    result.status = new_status
+                    if new_status == "approved":
+                        result.approval_date = today_iso()
+                    touch(project)
+            with cols[2]:
+                if result.approval_required and result.status == "completed":
+                    if st.button(f"Request Approval {phase_key}_{rkey}"):
+                        result.status = "approved"
+                        result.approval_date = today_iso()
+                        touch(project)
+                        st.success("Result approved")
+
 def results_management():
     st.header("📋 Results Management")
     project = st.session_state.hermes_project
     show_instructions("Results Management", t("results", project))
     for phase_key, phase in project.phases.items():
-        with st.expander(f"{phase.name} (status: {phase.status})", expanded=False):
-            # create results if empty (defaults)
-            if not phase.results:
-                # add example results depending on phase
-                if phase_key == "initialization":
-                    phase.results["Project Charter"] = PhaseResult(name="Project Charter", approval_required=True, responsible_role="Project Manager")
-                    phase.results["Stakeholder Analysis"] = PhaseResult(name="Stakeholder Analysis", responsible_role="Project Manager")
-                elif phase_key == "concept":
-                    phase.results["Solution Requirements"] = PhaseResult(name="Solution Requirements", approval_required=True, responsible_role="User Representative")
-                    phase.results["Solution Architecture"] = PhaseResult(name="Solution Architecture", approval_required=True, responsible_role="Project Manager")
-                elif phase_key == "implementation":
-                    phase.results["Increment Delivery"] = PhaseResult(name="Increment Delivery", responsible_role="Project Manager")
-                elif phase_key == "introduction":
-                    phase.results["Operational Handover"] = PhaseResult(name="Operational Handover", responsible_role="Project Manager")
-                elif phase_key == "completion":
-                    phase.results["Project Completion Report"] = PhaseResult(name="Project Completion Report", approval_required=True, responsible_role="Project Manager")
-            for rkey, result in phase.results.items():
-                cols = st.columns([3,1,1])
-                with cols[0]:
-                    st.write(f"**{result.name}**")
-                    if result.description:
-                        st.caption(result.description)
-                    st.caption(f"Responsible Role: {result.responsible_role or '—'}")
-                with cols[1]:
-                    new_status = st.selectbox(f"Status {phase_key}_{rkey}", ["not_started","in_progress","completed","approved"], index=["not_started","in_progress","completed","approved"].index(result.status))
-                    if new_status != result.status:
-                        result.status = new_status
-                        if new_status == "approved":
-                            result.approval_date = datetime.now().strftime("%Y-%m-%d")
-                with cols[2]:
-                    if result.approval_required and result.status == "completed":
-                        if st.button(f"Request Approval {phase_key}_{rkey}"):
-                            result.status = "approved"
-                            result.approval_date = datetime.now().strftime("%Y-%m-%d")
-                            st.success("Result approved")
+        phase_results(project, phase_key, phase)
 
 # ----------------------
 # DOCUMENTS CENTER
 # ----------------------
+@st.fragment
+def document_card(project: HermesProject, dname: str, doc: HermesDocument):
+    """One document; editing it only reruns this card, not the whole document list"""
+    with st.expander(f"{dname} - {doc.status}", expanded=False):
+        cols = st.columns([3,1])
+        with cols[0]:
+            st.write(f"**Responsible:** {doc.responsible}")
+            st.write(f"**Linked Result:** {doc.linked_result or '—'}")
+            doc.content = st.text_area(f"Content for {dname}", value=doc.content, key=f"content_{dname}")
+        with cols[1]:
+            new = st.selectbox(f"Status_{dname}", DOCUMENT_STATUSES, index=DOCUMENT_STATUS_IDX[doc.status])
+            if new != doc.status:
+                doc.status = new
+                # sync to result if applicable
+                if doc.status == "completed" and doc.linked_result:
+                    for p in project.phases.values():
+                        if doc.linked_result in p.results:
+                            p.results[doc.linked_result].status = "completed"
+                            touch(project)
+                            st.success(f"Linked result '{doc.linked_result}' updated to completed")
+                            break
+
 def documents_center():
     st.header("📄 Documents")
     project = st.session_state.hermes_project
@@ -510,27 +642,48 @@ def documents_center():
     # stats
     st.metric("Total documents", len(project.documents))
     for dname, doc in project.documents.items():
-        with st.expander(f"{dname} - {doc.status}", expanded=False):
-            cols = st.columns([3,1])
-            with cols[0]:
-                st.write(f"**Responsible:** {doc.responsible}")
-                st.write(f"**Linked Result:** {doc.linked_result or '—'}")
-                doc.content = st.text_area(f"Content for {dname}", value=doc.content, key=f"content_{dname}")
-            with cols[1]:
-                new = st.selectbox(f"Status_{dname}", ["not_started","in_progress","completed"], index=["not_started","in_progress","completed"].index(doc.status))
-                if new != doc.status:
-                    doc.status = new
-                    # sync to result if applicable
-                    if doc.status == "completed" and doc.linked_result:
-                        for p in project.phases.values():
-                            if doc.linked_result in p.results:
-                                p.results[doc.linked_result].status = "completed"
-                                st.success(f"Linked result '{doc.linked_result}' updated to completed")
-                                break
+        document_card(project, dname, doc)
 
 # ----------------------
 # BUDGET MANAGEMENT
 # ----------------------
+# transaction columns and a getter pulling them as one tuple (no per-row asdict copy)
+TX_COLUMNS = [f.name for f in fields(BudgetTransaction)]
+tx_row = attrgetter(*TX_COLUMNS)
+
+def m4_downsample(series: pd.Series, buckets: int = 1000) -> pd.Series:
+    """M4 reduction of a date-indexed series for plotting: keeps the first, last, min and max point
+    of each of `buckets` equal-width time buckets, so the drawn line looks the same with far fewer points"""
+    if len(series) <= 4 * buckets:
+        return series
+    x = series.index.asi8
+    lo, hi = x.min(), x.max()
+    frame = pd.DataFrame({"bucket": ((x - lo) / (hi - lo + 1) * buckets).astype("int64"), "y": series.to_numpy()})
+    g = frame.groupby("bucket")
+    keep = (pd.Index(g["y"].idxmin()).union(g["y"].idxmax())
+            .union(g.head(1).index).union(g.tail(1).index))
+    return series.iloc[keep]
+
+# Figures are cached as objects (cache_resource, no pickling): unpickling a plotly Figure would validate it
+# all over again. They are keyed by a content hash and never mutated after being built.
+@observed_cache(st.cache_resource(show_spinner=False, max_entries=32))
+def budget_figures(key: str, _df_act: pd.DataFrame):
+    """Spending-by-category pie and cumulative spending curve of the actual transactions"""
+    import plotly.express as px
+    cat_sum = _df_act.groupby('category')['amount'].sum()
+    fig = px.pie(values=cat_sum.values, names=cat_sum.index, title="Spending by Category")
+    # dates parsed once as a column (cache=True reuses repeated values), no write into the filtered slice
+    dates = pd.to_datetime(_df_act['date'], cache=True)
+    ts = m4_downsample(_df_act['amount'].groupby(dates).sum().cumsum())
+    fig2 = px.line(x=ts.index, y=ts.values, title="Cumulative Spending", render_mode="webgl")
+    return fig, fig2
+
+def add_transaction_from_form(project: HermesProject):
+    """Submit callback of the transaction form - runs before the rerun, so the metrics above already show the new entry"""
+    ss = st.session_state
+    tx = BudgetTransaction(date=ss.tx_date.isoformat(), category=ss.tx_category, amount=ss.tx_amount, description=ss.tx_description, type=ss.tx_type)
+    add_budget_transaction(project, tx)
+
 def budget_management():
     st.header("💰 Budget Management")
     project = st.session_state.hermes_project
@@ -538,7 +691,7 @@ def budget_management():
     col1, col2 = st.columns(2)
     with col1:
         st.metric("Planned Budget", f"CHF {project.master_data.budget:,.2f}")
-        actual = sum(t.amount for t in project.budget_entries if t.type=="actual")
+        actual = calculate_actual_costs(project)
         st.metric("Actual Costs", f"CHF {actual:,.2f}")
         st.metric("Remaining", f"CHF {project.master_data.budget - actual:,.2f}")
         usage = calculate_budget_usage(project)
@@ -550,36 +703,33 @@ def budget_management():
             st.error(f"Budget Usage: {usage:.1%}")
     with col2:
         with st.form("tx_form"):
-            date = st.date_input("Date", datetime.now())
-            cat = st.selectbox("Category", ["Personnel","Hardware","Software","External Services","Training","Travel","Other"])
-            amt = st.number_input("Amount (CHF)", min_value=0.0, value=0.0, step=100.0)
-            desc = st.text_input("Description")
-            typ = st.selectbox("Type", ["actual","planned"])
-            if st.form_submit_button("Add Transaction"):
-                tx = BudgetTransaction(date=date.strftime("%Y-%m-%d"), category=cat, amount=amt, description=desc, type=typ)
-                project.budget_entries.append(tx)
+            st.date_input("Date", datetime.now(), key="tx_date")
+            st.selectbox("Category", ["Personnel","Hardware","Software","External Services","Training","Travel","Other"], key="tx_category")
+            st.number_input("Amount (CHF)", min_value=0.0, value=0.0, step=100.0, key="tx_amount")
+            st.text_input("Description", key="tx_description")
+            st.selectbox("Type", ["actual","planned"], key="tx_type")
+            # mutate in the callback instead of st.rerun() after the fact, which would run the whole page twice
+            if st.form_submit_button("Add Transaction", on_click=add_transaction_from_form, args=(project,)):
                 st.success("Transaction added")
-                st.rerun()
     # show table and charts
     if project.budget_entries:
-        df = pd.DataFrame([asdict(t) for t in project.budget_entries])
+        df = pd.DataFrame([tx_row(t) for t in project.budget_entries], columns=TX_COLUMNS)
         st.dataframe(df, use_container_width=True)
         # pie by category (actual)
         df_act = df[df['type']=='actual']
         if not df_act.empty:
-            cat_sum = df_act.groupby('category')['amount'].sum()
-            fig = px.pie(values=cat_sum.values, names=cat_sum.index, title="Spending by Category")
+            fig, fig2 = budget_figures(content_key(project.budget_entries), df_act)
             st.plotly_chart(fig, use_container_width=True)
-            # cumulative
-            df_act['date'] = pd.to_datetime(df_act['date'])
-            ts = df_act.groupby('date')['amount'].sum().cumsum()
-            fig2 = px.line(x=ts.index, y=ts.values, title="Cumulative Spending")
             st.plotly_chart(fig2, use_container_width=True)
         # export
         if st.button("Export transactions to Excel"):
+            import xlsxwriter
             buf = BytesIO()
-            with pd.ExcelWriter(buf, engine='xlsxwriter') as w:
-                df.to_excel(w, sheet_name='Transactions', index=False)
+            # written straight from the transactions, no DataFrame-to-Excel bridge for one sheet
+            wb = xlsxwriter.Workbook(buf, {'constant_memory': True})
+            write_sheet(wb, 'Transactions', TX_COLUMNS, map(tx_row, project.budget_entries),
+                        wb.add_format({'bold': True, 'border': 1, 'align': 'center'}))
+            wb.close()
             st.download_button("Download Excel", data=buf.getvalue(), file_name=f"transactions_{datetime.now().strftime('%Y%m%d')}.xlsx")
 
 # ----------------------
@@ -593,17 +743,36 @@ def validate_milestone_completion(ms: HermesMilestone, project: HermesProject) -
             if r.approval_required and r.status != "approved":
                 result["phase_results_complete"]=False
                 break
+        docs = project.documents
         for doc_name in phase.required_documents:
-            d = project.documents.get(doc_name)
+            d = docs.get(doc_name)
             if d and d.required and d.status != "completed":
                 result["required_documents_complete"]=False
                 break
-        if phase.checklist_results:
-            if not all(phase.checklist_results.values()):
-                result["checklists_complete"]=False
-    result["can_reach"] = all([result["phase_results_complete"], result["required_documents_complete"], result["checklists_complete"]])
+        if not all(phase.checklist_results.values()):
+            result["checklists_complete"]=False
+    result["can_reach"] = result["phase_results_complete"] and result["required_documents_complete"] and result["checklists_complete"]
     return result
 
+@observed_cache(st.cache_resource(show_spinner=False, max_entries=32))
+def milestone_timeline_figure(key: str, day: str, _milestones: List[HermesMilestone], _now: datetime):
+    """Milestone timeline as one scatter trace; undated milestones are placed at `_now` (hence `day` in the key)"""
+    import plotly.graph_objects as go
+    dates, labels, colors_map = [], [], []
+    for ms in _milestones:
+        # stored dates are ISO strings; fromisoformat parses them in C, strptime goes through a regex per call
+        dates.append(datetime.fromisoformat(ms.date) if ms.date else _now)
+        labels.append(ms.name)
+        colors_map.append("green" if ms.status=="reached" else "blue")
+    fig = go.Figure(go.Scattergl(x=dates, y=list(range(len(dates))), mode='markers+text', marker=dict(size=14, color=colors_map), text=labels, textposition='middle right'))
+    fig.update_layout(yaxis=dict(showticklabels=False), height=350, title="Milestone timeline")
+    return fig
+
+def reach_milestone(ms: HermesMilestone):
+    # button callback: the status is set before the rerun renders the timeline and checks
+    ms.status = "reached"
+    ms.date = today_iso()
+
 def milestones_view():
     st.header("🎯 Milestones")
     project = st.session_state.hermes_project
@@ -611,27 +780,25 @@ def milestones_view():
     if not project.milestones:
         st.info("No milestones configured.")
         return
-    # plot
-    dates = []
-    labels = []
-    colors_map = []
-    for i, ms in enumerate(project.milestones):
-        d = datetime.now() if not ms.date else datetime.strptime(ms.date, "%Y-%m-%d")
-        dates.append(d)
-        labels.append(ms.name)
-        colors_map.append("green" if ms.status=="reached" else "blue")
-    fig = go.Figure()
-    for i,(d,l,c) in enumerate(zip(dates, labels, colors_map)):
-        fig.add_trace(go.Scatter(x=[d], y=[i], mode='markers+text', marker=dict(size=14, color=c), text=[l], textposition='middle right'))
-    fig.update_layout(yaxis=dict(showticklabels=False), height=350, title="Milestone timeline")
+    # plot: one WebGL trace for all milestones, cached per milestone content (undated ones sit at today)
+    now = datetime.now()
+    fig = milestone_timeline_figure(content_key(project.milestones), now.date().isoformat(), project.milestones, now)
     st.plotly_chart(fig, use_container_width=True)
-    # details
+    # validations computed once and reused below; they only depend on the milestone's phase,
+    # so milestones of one phase share one result
+    validations = []
+    by_phase = {}
     for ms in project.milestones:
+        validation = by_phase.get(ms.phase)
+        if validation is None:
+            validation = by_phase[ms.phase] = validate_milestone_completion(ms, project)
+        validations.append(validation)
+    # details
+    for ms, validation in zip(project.milestones, validations):
         with st.expander(f"{ms.name} ({ms.phase}) - {ms.status}", expanded=False):
             st.write(f"Mandatory: {'Yes' if ms.mandatory else 'No'}")
             if ms.date:
                 st.write("Date:", ms.date)
-            validation = validate_milestone_completion(ms, project)
             if validation["phase_results_complete"]:
                 st.success("Phase results OK")
             else:
@@ -646,11 +813,7 @@ def milestones_view():
                 st.error("Checklists not OK")
             if ms.status != "reached":
                 if validation["can_reach"]:
-                    if st.button(f"Reach milestone: {ms.name}"):
-                        ms.status = "reached"
-                        ms.date = datetime.now().strftime("%Y-%m-%d")
-                        st.success("Milestone reached")
-                        st.rerun()
+                    st.button(f"Reach milestone: {ms.name}", on_click=reach_milestone, args=(ms,))
                 else:
                     st.info("Milestone prerequisites not fulfilled")
 
@@ -674,7 +837,7 @@ def iterations_view():
             rc = st.checkbox("Release candidate")
             goals = st.text_area("Goals (one per line)").splitlines()
             if st.form_submit_button("Create iteration"):
-                it = Iteration(number=int(num), name=name, start_date=sd.strftime("%Y-%m-%d"), end_date=ed.strftime("%Y-%m-%d"),
+                it = Iteration(number=int(num), name=name, start_date=sd.isoformat(), end_date=ed.isoformat(),
                                total_user_stories=int(total), release_candidate=rc, goals=[g.strip() for g in goals if g.strip()])
                 project.iterations.append(it)
                 # create release result and doc
@@ -682,18 +845,19 @@ def iterations_view():
                 impl = project.phases.get("implementation")
                 if impl and release_result_name not in impl.results:
                     impl.results[release_result_name] = PhaseResult(name=release_result_name, approval_required=True, responsible_role="Project Manager")
+                    touch(project)
                 release_doc_name = f"Release Report {it.number}"
                 if release_doc_name not in project.documents:
                     project.documents[release_doc_name] = HermesDocument(name=release_doc_name, responsible="Project Manager", linked_result=release_result_name)
+                # the iteration list is rendered below this form, so it already includes the new one - no extra rerun
                 st.success("Iteration created")
-                st.rerun()
     # display iterations
     for it in project.iterations:
         with st.expander(f"{it.number} - {it.name} ({it.status})", expanded=False):
             st.write(f"Period: {it.start_date} to {it.end_date}")
             st.write(f"Progress: {it.progress():.1f}%")
             it.completed_user_stories = st.number_input(f"Completed stories {it.number}", min_value=0, max_value=it.total_user_stories, value=it.completed_user_stories, key=f"comp_{it.number}")
-            it.status = st.selectbox(f"Status {it.number}", ["planned","active","completed"], index=["planned","active","completed"].index(it.status), key=f"status_{it.number}")
+            it.status = st.selectbox(f"Status {it.number}", ITERATION_STATUSES, index=ITERATION_STATUS_IDX[it.status], key=f"status_{it.number}")
             if it.release_candidate:
                 st.info("Release candidate")
                 # validation for approval
@@ -704,47 +868,46 @@ def iterations_view():
                 if not it.release_approved and validation.get("can_approve", False):
                     if st.button(f"Approve release {it.number}"):
                         it.release_approved = True
+                        today = today_iso()
                         it.status = "completed"
                         # mark release result approved
                         impl = project.phases.get("implementation")
                         rr = f"Release {it.number}"
                         if impl and rr in impl.results:
                             impl.results[rr].status = "approved"
-                            impl.results[rr].approval_date = datetime.now().strftime("%Y-%m-%d")
+                            impl.results[rr].approval_date = today
+                            touch(project)
                         # add milestone
-                        project.milestones.append(HermesMilestone(name=f"Release {it.number}", phase="implementation", date=datetime.now().strftime("%Y-%m-%d"), status="reached", mandatory=False))
+                        project.milestones.append(HermesMilestone(name=f"Release {it.number}", phase="implementation", date=today, status="reached", mandatory=False))
                         st.success("Release approved")
 
 # release validation (safe)
 def validate_release_approval(iteration: Iteration, project: HermesProject) -> Dict[str,bool]:
-    res = {"release_document_complete": True, "release_result_approved": True, "budget_healthy": True, "milestones_on_track": True, "can_approve": True}
     rdoc = project.documents.get(f"Release Report {iteration.number}")
-    if not rdoc or rdoc.status != "completed":
-        res["release_document_complete"] = False
     impl = project.phases.get("implementation")
     rr = f"Release {iteration.number}"
-    if not impl or rr not in impl.results or impl.results[rr].status not in ["completed","approved"]:
-        res["release_result_approved"] = False
-    # budget health: safe calc
-    usage = calculate_budget_usage(project)
-    if usage > 0.9:
-        res["budget_healthy"] = False
-    # mandatory implementation-phase milestones reached?
-    cms = [m for m in project.milestones if m.mandatory and m.phase=="implementation"]
-    if any(m.status != "reached" for m in cms):
-        res["milestones_on_track"] = False
-    res["can_approve"] = all([res["release_document_complete"], res["release_result_approved"], res["budget_healthy"], res["milestones_on_track"]])
+    res = {
+        "release_document_complete": rdoc is not None and rdoc.status == "completed",
+        "release_result_approved": impl is not None and rr in impl.results and impl.results[rr].status in DONE_STATUSES,
+        # budget health: safe calc
+        "budget_healthy": calculate_budget_usage(project) <= 0.9,
+        # mandatory implementation-phase milestones reached? (one pass, stops at the first one that is not)
+        "milestones_on_track": not any(m.mandatory and m.phase=="implementation" and m.status != "reached" for m in project.milestones),
+    }
+    res["can_approve"] = all(res.values())
     return res
 
 # ----------------------
 # REPORTS (PDF & EXCEL) WITH CHARTS
 # ----------------------
-def generate_budget_chart_png(project: HermesProject) -> BytesIO:
-    actual = sum(t.amount for t in project.budget_entries if t.type=="actual")
+def generate_budget_chart_png(project: HermesProject, actual: Optional[float] = None) -> BytesIO:
+    if actual is None:
+        actual = calculate_actual_costs(project)
     planned = project.master_data.budget or 0.0
     remaining = max(planned - actual, 0.0)
     labels = ["Actual", "Remaining"]
     vals = [actual, remaining]
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots(figsize=(4,3))
     ax.pie(vals, labels=labels, autopct="%1.1f%%", startangle=90)
     ax.set_title("Budget Usage")
@@ -755,39 +918,52 @@ def generate_budget_chart_png(project: HermesProject) -> BytesIO:
     buf.seek(0)
     return buf
 
+@observed_cache(st.cache_resource(show_spinner=False))
+def pdf_styles():
+    """Sample stylesheet, parsed once per process on first use instead of per report"""
+    from reportlab.lib.styles import getSampleStyleSheet
+    return getSampleStyleSheet()
+
+@observed_cache(st.cache_resource(show_spinner=False))
+def pdf_table_style():
+    """Header-row style shared by all report tables, built once per process"""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    return TableStyle([('BACKGROUND',(0,0),(-1,0),colors.darkblue),('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),('GRID',(0,0),(-1,-1),0.5,colors.grey)])
+
 def generate_status_report_pdf(project: HermesProject) -> bytes:
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, LongTable
+    from reportlab.lib.pagesizes import A4
     buf = BytesIO()
     doc = SimpleDocTemplate(buf, pagesize=A4)
-    styles = getSampleStyleSheet()
+    styles = pdf_styles()
     story = []
     story.append(Paragraph(f"HERMES Project Status Report - {project.master_data.project_name}", styles['Title']))
     story.append(Spacer(1,12))
-    story.append(Paragraph(f"Report Date: {datetime.now().strftime('%Y-%m-%d')}", styles['Normal']))
+    story.append(Paragraph(f"Report Date: {today_iso()}", styles['Normal']))
     story.append(Spacer(1,8))
     # executive summary
     story.append(Paragraph("Executive Summary", styles['Heading2']))
-    tot = calculate_total_progress(project)
-    usage = calculate_budget_usage(project)
+    metrics = compute_project_metrics(project)
+    tot = metrics.progress
+    usage = metrics.budget_usage
     story.append(Paragraph(f"Overall progress: {tot:.1f}%, Budget used: {usage:.1%}", styles['Normal']))
     story.append(Spacer(1,8))
     # budget chart
-    chart = generate_budget_chart_png(project)
+    chart = generate_budget_chart_png(project, metrics.actual_costs)
     story.append(Image(chart, width=300, height=200))
     story.append(Spacer(1,12))
     # phases table (simple)
-    data = [["Phase","Status","Progress"]]
-    for k,p in project.phases.items():
-        data.append([p.name, p.status, f"{calculate_phase_progress(p):.1f}%"])
-    tbl = Table(data, colWidths=[150,150,150])
-    tbl.setStyle(TableStyle([('BACKGROUND',(0,0),(-1,0),colors.darkblue),('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),('GRID',(0,0),(-1,-1),0.5,colors.grey)]))
+    counts = metrics.phase_counts
+    data = [["Phase","Status","Progress","Completed Results"]] + [[p.name, p.status, f"{metrics.phase_progress[k]:.1f}%", "%d/%d" % counts[k]] for k,p in project.phases.items()]
+    tbl = LongTable(data, colWidths=[150,110,90,100], repeatRows=1, splitByRow=1)
+    tbl.setStyle(pdf_table_style())
     story.append(tbl)
     story.append(Spacer(1,12))
     # milestones
-    msdata = [["Milestone","Phase","Status","Date"]]
-    for m in project.milestones:
-        msdata.append([m.name, m.phase, m.status, m.date or "Not set"])
-    ms_tbl = Table(msdata, colWidths=[150,120,100,100])
-    ms_tbl.setStyle(TableStyle([('BACKGROUND',(0,0),(-1,0),colors.darkblue),('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),('GRID',(0,0),(-1,-1),0.5,colors.grey)]))
+    msdata = [["Milestone","Phase","Status","Date"]] + [[m.name, m.phase, m.status, m.date or "Not set"] for m in project.milestones]
+    ms_tbl = LongTable(msdata, colWidths=[150,120,100,100], repeatRows=1, splitByRow=1)
+    ms_tbl.setStyle(pdf_table_style())
     story.append(ms_tbl)
     story.append(Spacer(1,12))
     # recommendations
@@ -796,33 +972,41 @@ def generate_status_report_pdf(project: HermesProject) -> bytes:
         story.append(Paragraph("Review budget allocation - high usage detected", styles['Normal']))
     # build and return
     doc.build(story)
-    buf.seek(0)
     return buf.getvalue()
 
+def write_sheet(wb, name: str, headers, rows, header_format=None):
+    """Write a header row plus data rows to a new worksheet (row by row, as constant_memory requires)"""
+    ws = wb.add_worksheet(name)
+    ws.write_row(0, 0, headers, header_format)
+    for i, row in enumerate(rows, start=1):
+        ws.write_row(i, 0, row)
+    return ws
+
 def generate_status_report_excel(project: HermesProject) -> bytes:
+    import xlsxwriter
+    metrics = compute_project_metrics(project)
     buf = BytesIO()
-    with pd.ExcelWriter(buf, engine='xlsxwriter') as writer:
-        # Master
-        md = project.master_data
-        dfm = pd.DataFrame([{"Project Name": md.project_name, "Client": md.client, "Project Manager": md.project_manager, "Start Date": md.start_date, "Budget": md.budget, "Approach": md.approach, "Size": md.project_size}])
-        dfm.to_excel(writer, sheet_name='Master', index=False)
-        # phases
-        phases_list = []
-        for k,p in project.phases.items():
-            phases_list.append({"Phase": p.name, "Status": p.status, "Progress": f"{calculate_phase_progress(p):.1f}%"})
-        pd.DataFrame(phases_list).to_excel(writer, sheet_name='Phases', index=False)
-        # milestones
-        pd.DataFrame([asdict(m) for m in project.milestones]).to_excel(writer, sheet_name='Milestones', index=False)
-        # budget transactions
-        if project.budget_entries:
-            pd.DataFrame([asdict(t) for t in project.budget_entries]).to_excel(writer, sheet_name='Transactions', index=False)
-        # results
-        results = []
-        for pk,p in project.phases.items():
-            for rn,r in p.results.items():
-                results.append({"Phase": p.name, "Result": r.name, "Status": r.status, "Approval required": r.approval_required, "Approval date": r.approval_date, "Responsible": r.responsible_role})
-        pd.DataFrame(results).to_excel(writer, sheet_name='Results', index=False)
-    buf.seek(0)
+    # constant_memory flushes every row as it is written instead of holding the workbook in memory
+    wb = xlsxwriter.Workbook(buf, {'constant_memory': True})
+    hdr = wb.add_format({'bold': True, 'border': 1, 'align': 'center'})
+    # Master
+    md = project.master_data
+    write_sheet(wb, 'Master', ["Project Name", "Client", "Project Manager", "Start Date", "Budget", "Approach", "Size"],
+                [(md.project_name, md.client, md.project_manager, md.start_date, md.budget, md.approach, md.project_size)], hdr)
+    # phases
+    write_sheet(wb, 'Phases', ["Phase", "Status", "Progress"],
+                ((p.name, p.status, f"{metrics.phase_progress[k]:.1f}%") for k, p in project.phases.items()), hdr)
+    # milestones
+    write_sheet(wb, 'Milestones', ["name", "phase", "date", "status", "mandatory"],
+                ((m.name, m.phase, m.date, m.status, m.mandatory) for m in project.milestones), hdr)
+    # budget transactions
+    if project.budget_entries:
+        write_sheet(wb, 'Transactions', TX_COLUMNS, map(tx_row, project.budget_entries), hdr)
+    # results (streamed straight from the phases, no intermediate row list)
+    results = ((p.name, r.name, r.status, r.approval_required, r.approval_date, r.responsible_role)
+               for p in project.phases.values() for r in p.results.values())
+    write_sheet(wb, 'Results', ["Phase", "Result", "Status", "Approval required", "Approval date", "Responsible"], results, hdr)
+    wb.close()
     return buf.getvalue()
 
 # ----------------------
@@ -830,16 +1014,53 @@ def generate_status_report_excel(project: HermesProject) -> bytes:
 # ----------------------
 def export_project_json(project: HermesProject) -> bytes:
     d = dataclass_to_dict(project)
-    return json.dumps(d, indent=2).encode("utf-8")
+    return orjson.dumps(d, option=orjson.OPT_INDENT_2)
 
 def import_project_json_bytes(b: bytes) -> HermesProject:
     try:
-        d = json.loads(b.decode("utf-8"))
+        d = orjson.loads(b)
         return dict_to_dataclass(d)
     except Exception as e:
         st.error(f"Import error: {e}")
         return HermesProject()
 
+# ----------------------
+# REPORT CACHE (reuse PDF/Excel bytes until the project changes)
+# ----------------------
+def project_fingerprint(project: HermesProject) -> str:
+    """Content hash of the project - changes whenever any field is mutated.
+    Hashes compact orjson output (dataclasses serialized natively), not the indented export."""
+    return content_key(project)
+
+# the leading underscore keeps Streamlit from hashing the project itself; the fingerprint is the key
+@observed_cache(st.cache_data(show_spinner=False, max_entries=16))
+def cached_status_report_pdf(fingerprint: str, report_date: str, _project: HermesProject) -> bytes:
+    return generate_status_report_pdf(_project)
+
+@observed_cache(st.cache_data(show_spinner=False, max_entries=16))
+def cached_status_report_excel(fingerprint: str, _project: HermesProject) -> bytes:
+    return generate_status_report_excel(_project)
+
+def status_report_pdf(project: HermesProject) -> bytes:
+    # the report date is printed in the PDF, so it is part of the key
+    return cached_status_report_pdf(project_fingerprint(project), today_iso(), project)
+
+def status_report_excel(project: HermesProject) -> bytes:
+    return cached_status_report_excel(project_fingerprint(project), project)
+
+@observed_cache(st.cache_data(show_spinner=False, max_entries=16))
+def cached_status_reports(fingerprint: str, report_date: str, _project: HermesProject) -> Tuple[bytes, bytes]:
+    # only the Excel build goes to a worker: the PDF uses st.cache_resource styles and pyplot,
+    # which must stay on the script thread. Metrics are filled in first so the worker only reads them.
+    compute_project_metrics(_project)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        f_xl = ex.submit(generate_status_report_excel, _project)
+        return generate_status_report_pdf(_project), f_xl.result()
+
+def status_reports(project: HermesProject) -> Tuple[bytes, bytes]:
+    """(pdf, xlsx) bytes for the project, generated concurrently on a cache miss"""
+    return cached_status_reports(project_fingerprint(project), today_iso(), project)
+
 # ----------------------
 # DASHBOARD
 # ----------------------
@@ -860,11 +1081,14 @@ def dashboard_view():
     with col4:
         st.metric("Language", project.master_data.language.upper())
     # phase progress
+    metrics = compute_project_metrics(project)
     st.subheader("Phase progress")
     for k,p in project.phases.items():
-        prog = calculate_phase_progress(p)
+        prog = metrics.phase_progress[k]
+        done, total = metrics.phase_counts[k]
         st.write(f"**{p.name}**: {prog:.1f}%")
         st.progress(prog/100)
+        st.caption(f"{done}/{total} results completed")
     # next milestones
     st.subheader("Next milestones")
     nextms = [m for m in project.milestones if m.status == "planned"][:5]
@@ -876,12 +1100,13 @@ def dashboard_view():
     # reports
     st.markdown("---")
     st.subheader("Reports")
-    if st.button("Download PDF Report"):
-        pdf = generate_status_report_pdf(project)
-        st.download_button("Download PDF", data=pdf, file_name=f"status_{project.master_data.project_name}_{datetime.now().strftime('%Y%m%d')}.pdf", mime="application/pdf")
-    if st.button("Download Excel Report"):
-        x = generate_status_report_excel(project)
-        st.download_button("Download Excel", data=x, file_name=f"status_{project.master_data.project_name}_{datetime.now().strftime('%Y%m%d')}.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+    if st.button("Prepare PDF & Excel Reports"):
+        pdf, x = status_reports(project)
+        col_pdf, col_x = st.columns(2)
+        with col_pdf:
+            st.download_button("Download PDF", data=pdf, file_name=f"status_{project.master_data.project_name}_{datetime.now().strftime('%Y%m%d')}.pdf", mime="application/pdf")
+        with col_x:
+            st.download_button("Download Excel", data=x, file_name=f"status_{project.master_data.project_name}_{datetime.now().strftime('%Y%m%d')}.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
 # ----------------------
 # SIDEBAR: save/load
@@ -904,6 +1129,18 @@ def sidebar_persistence():
         except Exception as e:
             st.sidebar.error(f"Import failed: {e}")
 
+def sidebar_cache_stats():
+    """Hit/miss counters and miss timings of the observed caches (only rendered with ?debug=1)"""
+    stats = cache_stats()
+    with st.sidebar.expander("Cache stats", expanded=False):
+        if not stats:
+            st.write("No cached calls yet")
+            return
+        df = pd.DataFrame.from_dict(stats, orient="index")
+        df.insert(1, "hits", df["calls"] - df["misses"])
+        df["avg_miss_ms"] = (df["miss_seconds"] / df["misses"].where(df["misses"] > 0) * 1000).round(2)
+        st.dataframe(df.drop(columns="miss_seconds"), use_container_width=True)
+
 # ----------------------
 # ENTRY POINT
 # ----------------------
@@ -933,10 +1170,10 @@ def main():
         project = st.session_state.hermes_project
         show_instructions("Reports","Generate professional PDF/Excel reports including charts and export project JSON.")
         if st.button("Generate PDF report"):
-            pdf = generate_status_report_pdf(project)
+            pdf = status_report_pdf(project)
             st.download_button("Download PDF", data=pdf, file_name=f"status_{project.master_data.project_name}_{datetime.now().strftime('%Y%m%d')}.pdf", mime="application/pdf")
         if st.button("Generate Excel report"):
-            x = generate_status_report_excel(project)
+            x = status_report_excel(project)
             st.download_button("Download Excel", data=x, file_name=f"status_{project.master_data.project_name}_{datetime.now().strftime('%Y%m%d')}.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
     elif menu == "Information":
         st.header("Information")
@@ -947,6 +1184,9 @@ def main():
     st.markdown("---")
     project = st.session_state.hermes_project
     st.caption(f"Project: {project.master_data.project_name or '[none]'} | Phase: {project.current_phase} | Progress: {calculate_total_progress(project):.1f}%")
+    # rendered last so the counters include this run's page
+    if st.query_params.get("debug") == "1":
+        sidebar_cache_stats()
 
 if __name__ == "__main__":
     main()